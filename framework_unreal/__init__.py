@@ -1,5 +1,4 @@
 import importlib
-from . import core, tests
+from . import core
 
 importlib.reload(core)
-importlib.reload(tests)
\ No newline at end of file
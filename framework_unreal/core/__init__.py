@@ -1,5 +1,13 @@
 import importlib
-from . import asset, level
+from . import asset, levelSequence, material, level
 
 importlib.reload(asset)
-importlib.reload(level)
\ No newline at end of file
+importlib.reload(levelSequence)
+importlib.reload(material)
+importlib.reload(level)
+
+from ._cache import invalidate_dir  # noqa: E402,F401
+from .asset import BaseAsset, FBXImporter  # noqa: E402,F401
+from .level import LevelAsset  # noqa: E402,F401
+from .levelSequence import LevelSequenceAsset  # noqa: E402,F401
+from .material import MaterialAsset  # noqa: E402,F401
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import Dict, Optional, Set, Tuple
+
+import unreal
+
+#: LevelSequences déjà créées, partagées entre les instances de LevelAsset :
+#: une séquence commune à plusieurs levels n'est résolue/créée qu'une fois.
+_SEQ_CACHE: Dict[Tuple[str, str], object] = {}
+
+
+def get_sequence(sequence_path: str, sequence_name: str) -> Optional[object]:
+    """Return an already-resolved LevelSequence, if any.
+
+    Args:
+        sequence_path (str): The path where the sequence lives.
+        sequence_name (str): The name of the sequence.
+
+    Returns:
+        Optional[object]: The cached sequence, or None on miss.
+    """
+    return _SEQ_CACHE.get((sequence_path, sequence_name))
+
+
+def store_sequence(sequence_path: str, sequence_name: str, sequence: object) -> None:
+    """Remember a resolved LevelSequence for later reuse.
+
+    Args:
+        sequence_path (str): The path where the sequence lives.
+        sequence_name (str): The name of the sequence.
+        sequence (object): The resolved LevelSequence object.
+    """
+    _SEQ_CACHE[(sequence_path, sequence_name)] = sequence
+
+
+def invalidate(sequence_path: str) -> None:
+    """Drop every cached sequence under a path, e.g. after a delete.
+
+    Args:
+        sequence_path (str): The path whose sequences must be forgotten.
+    """
+    for key in [key for key in _SEQ_CACHE if key[0] == sequence_path]:
+        del _SEQ_CACHE[key]
+
+
+#: Dossiers dont l'existence est déjà confirmée : un pipeline créant
+#: plusieurs levels sous la même racine ne re-vérifie pas le dossier.
+_DIR_EXISTS: Set[str] = set()
+
+
+def dir_exists(path: str) -> bool:
+    """Check a directory's existence, remembering positive answers.
+
+    Args:
+        path (str): The directory path to check.
+
+    Returns:
+        bool: True if the directory exists; otherwise False.
+    """
+    if path in _DIR_EXISTS:
+        return True
+    if unreal.EditorAssetLibrary.does_directory_exist(path):
+        _DIR_EXISTS.add(path)
+        return True
+    return False
+
+
+def note_dir_created(path: str) -> None:
+    """Record that a directory was just created.
+
+    Args:
+        path (str): The directory path that now exists.
+    """
+    _DIR_EXISTS.add(path)
+
+
+def invalidate_dir(path: str) -> None:
+    """Forget a directory's cached existence, e.g. after external changes.
+
+    Args:
+        path (str): The directory path to forget.
+    """
+    _DIR_EXISTS.discard(path)
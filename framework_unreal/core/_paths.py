@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+
+def join_asset_path(*parts: str) -> str:
+    """Join path fragments into a canonical asset path.
+
+    Each fragment is stripped of stray slashes before joining, so callers
+    cannot produce double-slash paths (e.g. a destination path ending with
+    "/"), and the result is built in a single allocation.
+
+    Args:
+        *parts (str): The path fragments to join, e.g. "/Game/Test", "MAP_A".
+
+    Returns:
+        str: The joined asset path, e.g. "/Game/Test/MAP_A".
+    """
+    return "/" + "/".join(part.strip("/") for part in parts if part)
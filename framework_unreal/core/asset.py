@@ -1,7 +1,177 @@
-from typing import Type, Optional, Union, List, Dict
+from __future__ import annotations
+
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Type, Optional, List, Dict
+import contextlib
+import functools
+import os
+import queue
+import threading
 import unreal
 import re
 
+from ._paths import join_asset_path
+
+
+#: Quand False, les messages de log informatifs ne sont même pas formatés.
+_VERBOSE: bool = True
+
+
+def _v(message) -> None:
+    """Log a lazily-built informational message.
+
+    The callable is only invoked when verbose logging is enabled, so the
+    string is never formatted on silenced hot paths.
+
+    Args:
+        message (Callable[[], str]): Builds the message to log.
+    """
+    if _VERBOSE:
+        unreal.log(message())
+
+
+def _v_warning(message) -> None:
+    """Log a lazily-built warning message.
+
+    Contrairement à _v, les warnings ne sont jamais réduits au silence :
+    quiet_logs ne couvre que l'informatif, les diagnostics (fichier
+    manquant, asset déjà existant) restent visibles pendant les batches.
+
+    Args:
+        message (Callable[[], str]): Builds the message to log.
+    """
+    unreal.log_warning(message())
+
+
+@contextlib.contextmanager
+def quiet_logs():
+    """Silence the package's informational logging inside the context.
+
+    Bulk callers wrap their batch with this so the _v helper skips
+    message building entirely while the batch runs; warnings emitted
+    through _v_warning are not affected.
+    """
+    global _VERBOSE
+    previous = _VERBOSE
+    _VERBOSE = False
+    try:
+        yield
+    finally:
+        _VERBOSE = previous
+
+
+#: Par thread : liste des chemins à sauvegarder quand deferred_save est actif.
+_DEFERRED_SAVES = threading.local()
+
+_ASSET_TOOLS: Optional["unreal.AssetTools"] = None
+
+
+def _get_asset_tools() -> "unreal.AssetTools":
+    """Return the AssetTools singleton, resolving it only once.
+
+    Every call to ``unreal.AssetToolsHelpers.get_asset_tools()`` is a
+    Python to C++ round-trip; the handle is cached at module level so the
+    lookup is paid a single time per session.
+
+    Returns:
+        unreal.AssetTools: The cached AssetTools handle.
+    """
+    global _ASSET_TOOLS
+    if _ASSET_TOOLS is None:
+        _ASSET_TOOLS = unreal.AssetToolsHelpers.get_asset_tools()
+    return _ASSET_TOOLS
+
+
+#: Listings de répertoires mémorisés par racine. Ensembles mutables : les
+#: créations du package s'y insèrent au fil de l'eau, sans re-parcourir
+#: le registry à chaque asset créé.
+_EXISTING_BY_ROOT: Dict[str, set] = {}
+
+
+def _list_existing(root: str) -> set:
+    """List the package names living under a directory, once per root.
+
+    The registry walk is paid a single time per root and the resulting
+    set turns subsequent existence checks into O(1) membership tests.
+    Creations made through this package are folded in via _note_created;
+    stale after external writes, see BaseAsset.invalidate_cache.
+
+    Args:
+        root (str): The directory to list, e.g. "/Game/Levels".
+
+    Returns:
+        set: The package names of every asset under the root.
+    """
+    listing = _EXISTING_BY_ROOT.get(root)
+    if listing is None:
+        registry = unreal.AssetRegistryHelpers.get_asset_registry()
+        listing = {
+            str(asset_data.package_name)
+            for asset_data in registry.get_assets_by_path(root, recursive=True)
+        }
+        _EXISTING_BY_ROOT[root] = listing
+    return listing
+
+
+def _note_created(asset_path: str) -> None:
+    """Fold a freshly created asset into the cached listings.
+
+    Keeps the cache warm during bulk create loops: inserting the new
+    path is O(roots) instead of clearing everything and re-walking the
+    registry on the next check.
+
+    Args:
+        asset_path (str): The package path of the created asset.
+    """
+    for root, listing in _EXISTING_BY_ROOT.items():
+        if asset_path.startswith(root + "/"):
+            listing.add(asset_path)
+
+
+@functools.lru_cache(maxsize=None)
+def _template_prefix(template: str) -> str:
+    """Return the prefix part of a name template.
+
+    Computed once per template string, e.g. "MAP_" for "MAP_{}".
+
+    Args:
+        template (str): The attribute name template.
+
+    Returns:
+        str: The template prefix.
+    """
+    return template.split("{}", 1)[0]
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_pattern(template: str) -> "re.Pattern":
+    """Compile the validation regex for an attribute name template.
+
+    The result is memoized per template string, so repeated validations
+    reuse the compiled pattern instead of recompiling it on every call.
+
+    Args:
+        template (str): The attribute name template, e.g. "MAP_{}".
+
+    Returns:
+        re.Pattern: The compiled validation pattern.
+    """
+    return re.compile(template.format(r"\w+"))
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_bulk_pattern(template: str) -> "re.Pattern":
+    """Compile the multiline validation regex for bulk name checks.
+
+    Args:
+        template (str): The attribute name template, e.g. "MAP_{}".
+
+    Returns:
+        re.Pattern: The compiled pattern, anchored per line.
+    """
+    return re.compile("^(?:" + template.format(r"\w+") + ")$", re.M)
+
 
 class BaseAsset:
     """Base class for creating assets in Unreal.
@@ -17,6 +187,19 @@ class BaseAsset:
         asset_name (str): The name of the asset to create.
     """
 
+    __slots__ = (
+        "asset_path",
+        "asset_type",
+        "asset_name",
+        "_full_path",
+        "_asset_tools",
+        "_path_name",
+    )
+
+    #: Name template of the subclass, e.g. "MAP_{}". Resolved once per class
+    #: instead of rebuilding the template on every asset construction.
+    _NAME_TEMPLATE: Optional[str] = None
+
     def __init__(
         self, asset_path: str, asset_name: str, asset_type: Type[unreal.Object]
     ):
@@ -30,19 +213,29 @@ class BaseAsset:
         self.asset_path: str = asset_path
         self.asset_type: Type[unreal.Object] = asset_type
         self.asset_name: str = self._get_asset_name(asset_name)
+        self._full_path: str = join_asset_path(self.asset_path, self.asset_name)
+        self._asset_tools: unreal.AssetTools = _get_asset_tools()
+        self._path_name: Optional[str] = None
 
-    def attribute_name_template(self) -> str:
+    @classmethod
+    def attribute_name_template(cls) -> str:
         """Get the attribute name template.
 
+        The template is a per-class constant, so no instance state is
+        needed; subclasses whose template is dynamic (MaterialAsset)
+        override this with an instance method.
+
         Raises:
-            NotImplementedError: If the method is not implemented in the derived class.
+            NotImplementedError: If _NAME_TEMPLATE is not defined in the derived class.
 
         Returns:
             str: The attribute name template.
         """
-        raise NotImplementedError(
-            "La méthode _get_creation_options doit être définie dans la classe dérivée."
-        )
+        if cls._NAME_TEMPLATE is None:
+            raise NotImplementedError(
+                "L'attribut _NAME_TEMPLATE doit être défini dans la classe dérivée."
+            )
+        return cls._NAME_TEMPLATE
 
     def is_valid_attribute_name(self, name: str) -> bool:
         """Checks if an attribute name is valid.
@@ -53,36 +246,129 @@ class BaseAsset:
         Returns:
             bool: True if the attribute name is valid; otherwise False.
         """
-        pattern = self.attribute_name_template().format(r"\w+")
-        return bool(re.match(pattern, name))
+        return bool(
+            _compiled_pattern(self.attribute_name_template()).fullmatch(name)
+        )
+
+    def filter_valid(self, names: List[str]) -> List[bool]:
+        """Validate many attribute names in a single regex pass.
+
+        The names are joined into one buffer and matched with a multiline
+        pattern, so the C regex engine streams over the whole batch instead
+        of one Python-level match call per name. The per-line anchors give
+        the same verdicts as :meth:`is_valid_attribute_name`.
+
+        Args:
+            names (List[str]): The attribute names to check.
 
-    def check_asset_exists(self, asset_path: str) -> Optional[bool]:
+        Returns:
+            List[bool]: One flag per name, True when the name is valid.
+        """
+        if not names:
+            return []
+        pattern = _compiled_bulk_pattern(self.attribute_name_template())
+        # Un nom contenant un saut de ligne casserait le buffer joint :
+        # invalide d'office, et exclu du blob.
+        positions: List[Optional[int]] = []
+        parts = []
+        position = 0
+        for name in names:
+            if "\n" in name:
+                positions.append(None)
+                continue
+            positions.append(position)
+            parts.append(name)
+            position += len(name) + 1
+        hits = {match.start() for match in pattern.finditer("\n".join(parts))}
+        return [
+            position is not None and position in hits for position in positions
+        ]
+
+    def check_asset_exists(self, asset_path: Optional[str] = None) -> bool:
         """Check if an asset exists in Unreal Engine.
 
+        The assets living under the parent directory are listed once through
+        the shared ``_list_existing`` cache, so repeated checks (e.g. bulk
+        ``create_asset`` calls) are simple membership tests instead of one
+        registry round-trip per asset. The hot path is exception-free;
+        callers doing batch work should wrap the batch entry point instead.
+
         Args:
-            asset_path (str): The path to the asset to check.
+            asset_path (Optional[str]): The path to the asset to check.
+                Defaults to the instance's own full path.
 
         Returns:
-            Optional[bool]: True if the asset exists, False if it does not exist,
-            and None if an error occurred.
+            bool: True if the asset exists; otherwise False.
         """
-        try:
-            return unreal.EditorAssetLibrary.does_asset_exist(asset_path)
-        except Exception as e:
-            print(f"An error occurred while checking if the asset exists: {e}")
-            return None
+        if asset_path is None:
+            asset_path = self._full_path
+        root = asset_path.rsplit("/", 1)[0]
+        return asset_path in _list_existing(root)
+
+    @classmethod
+    def invalidate_cache(cls, root: Optional[str] = None) -> None:
+        """Drop the cached directory listings after external writes.
+
+        Creations made through this package keep the cache up to date on
+        their own; this hook is for assets written behind its back.
+
+        Args:
+            root (Optional[str]): Only evict the listing of that root;
+                clears every cached root when omitted.
+        """
+        if root is not None:
+            _EXISTING_BY_ROOT.pop(root, None)
+        else:
+            _EXISTING_BY_ROOT.clear()
+
+    @staticmethod
+    def check_many(asset_paths: List[str]) -> Dict[str, bool]:
+        """Check the existence of many assets at once.
+
+        The registry is listed once per distinct parent directory, so N
+        checks cost one bulk fetch per directory plus hashed lookups.
 
-    def _get_asset_name(self, asset_name: str, key_name: str = "default") -> str:
+        Args:
+            asset_paths (List[str]): The paths of the assets to check.
+
+        Returns:
+            Dict[str, bool]: Existence flag for each requested path.
+        """
+        registry = unreal.AssetRegistryHelpers.get_asset_registry()
+        listings: Dict[str, set] = {}
+        results: Dict[str, bool] = {}
+        for asset_path in asset_paths:
+            directory, _, name = asset_path.rpartition("/")
+            if directory not in listings:
+                listings[directory] = {
+                    str(asset_data.asset_name)
+                    for asset_data in registry.get_assets_by_path(
+                        directory, recursive=False
+                    )
+                }
+            results[asset_path] = name in listings[directory]
+        return results
+
+    def _get_asset_name(self, asset_name: str) -> str:
         """Get the asset name.
 
         Args:
             asset_name (str): The base name of the asset.
-            key_name (str): The key name for the template. Defaults to "default".
 
         Returns:
-            str: The full name of the asset.
+            str: The full name of the asset. Names already carrying the
+            template prefix are returned unchanged.
         """
-        return self.attribute_name_template().format(asset_name)
+        template = self.attribute_name_template()
+        prefix = _template_prefix(template)
+        if prefix and asset_name.startswith(prefix):
+            return asset_name
+        # Tous les templates du pipeline sont de purs préfixes ("MAP_{}",
+        # "LS_{}", ...) : une concaténation suffit, sans passer par le
+        # parseur de template.
+        if template == prefix + "{}":
+            return prefix + asset_name
+        return template.replace("{}", asset_name, 1)
 
     def _get_creation_options(self) -> None:
         """Define the asset creation options.
@@ -94,41 +380,301 @@ class BaseAsset:
             "The _get_creation_options method must be defined in the derived class."
         )
 
-    def create_asset(self) -> unreal.Object:
+    def create_asset(self, save: bool = True) -> unreal.Object:
         """Create the asset.
 
+        Args:
+            save (bool): Whether to save the asset right away. Batch callers
+                pass False and save once at the end of the batch.
+
         Returns:
             unreal.Object: The created asset object.
         """
-        if self.check_asset_exists(self.asset_path):
-            unreal.log_warning(
-                "The asset {} already exists in the path {}.".format(
-                    self.asset_name, self.asset_path
-                )
+        if self.check_asset_exists(self._full_path):
+            _v_warning(
+                lambda: f"The asset {self.asset_name} already exists "
+                f"in the path {self.asset_path}."
             )
             return None
         else:
             options = self._get_creation_options()
-            asset = unreal.AssetToolsHelpers.get_asset_tools().create_asset(
+            asset = self._asset_tools.create_asset(
                 self.asset_name, self.asset_path, self.asset_type, options
             )
             if asset:
-                self.save_asset(asset)
-            unreal.log(
-                "The asset {} was created in the path {}.".format(
-                    self.asset_name, self.asset_path
-                )
+                self._path_name = asset.get_path_name()
+                if save:
+                    self.save_asset(asset)
+                _note_created(self._full_path)
+            _v(
+                lambda: f"The asset {self.asset_name} was created "
+                f"in the path {self.asset_path}."
             )
             return asset
 
     def save_asset(self, asset: unreal.Object) -> None:
         """Save the asset.
 
+        The UObject to string path conversion is cached on the instance so
+        repeated saves of the same asset skip the marshalling cost. Inside
+        a :meth:`deferred_save` context, the path is only recorded and the
+        disk flush happens once at context exit.
+
         Args:
             asset (unreal.Object): The asset object to save.
         """
-        unreal.EditorAssetLibrary.save_asset(asset.get_path_name())
-        unreal.log("The asset {} has been saved.".format(self.asset_name))
+        if self._path_name is None:
+            self._path_name = asset.get_path_name()
+        deferred = getattr(_DEFERRED_SAVES, "paths", None)
+        if deferred is not None:
+            deferred.append(self._path_name)
+            return
+        unreal.EditorAssetLibrary.save_asset(self._path_name)
+        _v(lambda: f"The asset {self.asset_name} has been saved.")
+
+    @classmethod
+    @contextlib.contextmanager
+    def deferred_save(cls):
+        """Defer every save_asset call made inside the context.
+
+        While active, save_asset records asset paths instead of flushing
+        to disk; on exit, the recorded paths are grouped by parent
+        directory and one save_directory(only_if_is_dirty=True) call is
+        issued per directory, amortizing N synchronous saves into one
+        flush per folder. Nesting reuses the outermost context.
+        """
+        if getattr(_DEFERRED_SAVES, "paths", None) is not None:
+            yield
+            return
+        _DEFERRED_SAVES.paths = []
+        try:
+            yield
+        finally:
+            paths = _DEFERRED_SAVES.paths
+            _DEFERRED_SAVES.paths = None
+            for directory in {path.rsplit("/", 1)[0] for path in paths}:
+                unreal.EditorAssetLibrary.save_directory(
+                    directory, only_if_is_dirty=True, recursive=False
+                )
+
+    @staticmethod
+    def save_many(assets: List[unreal.Object]) -> None:
+        """Save several loaded assets in a single editor call.
+
+        Args:
+            assets (List[unreal.Object]): The loaded assets to save.
+        """
+        unreal.EditorAssetLibrary.save_loaded_assets(assets, only_if_is_dirty=True)
+
+
+#: Classe AssetRenameData pré-liée : évite de re-résoudre la chaîne
+#: d'attributs unreal.* à chaque construction de renommage.
+_ARD = unreal.AssetRenameData
+
+
+def _rename_skeletal_mesh(
+    asset: unreal.SkeletalMesh, destination_path: str, asset_name: str
+) -> List["unreal.AssetRenameData"]:
+    """Build the rename records for an imported skeletal mesh.
+
+    Args:
+        asset (unreal.SkeletalMesh): The imported skeletal mesh.
+        destination_path (str): The path the asset was imported to.
+        asset_name (str): The base name of the asset.
+
+    Returns:
+        List[unreal.AssetRenameData]: The renames for the mesh and its
+        physics asset and skeleton when they exist.
+    """
+    renames = [_ARD(asset, destination_path, "SKM_" + asset_name)]
+
+    # Rename physics asset if it exists
+    physics_asset: unreal.PhysicsAsset = asset.get_editor_property("physics_asset")
+    if physics_asset:
+        renames.append(_ARD(physics_asset, destination_path, "PA_" + asset_name))
+
+    # Rename skeleton asset if it exists
+    skeleton: unreal.Skeleton = asset.get_editor_property("skeleton")
+    if skeleton:
+        renames.append(_ARD(skeleton, destination_path, "SKL_" + asset_name))
+    return renames
+
+
+def _rename_static_mesh(
+    asset: unreal.StaticMesh, destination_path: str, asset_name: str
+) -> List["unreal.AssetRenameData"]:
+    """Build the rename record for an imported static mesh.
+
+    Args:
+        asset (unreal.StaticMesh): The imported static mesh.
+        destination_path (str): The path the asset was imported to.
+        asset_name (str): The base name of the asset.
+
+    Returns:
+        List[unreal.AssetRenameData]: The rename for the mesh.
+    """
+    return [_ARD(asset, destination_path, "SM_" + asset_name)]
+
+
+#: Dispatch table résolue par type(asset) : un hash lookup remplace la
+#: chaîne d'isinstance dans la boucle de renommage.
+_RENAME_HANDLERS = {
+    unreal.SkeletalMesh: _rename_skeletal_mesh,
+    unreal.StaticMesh: _rename_static_mesh,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_rename_handler(asset_class: type):
+    """Resolve the rename handler for a concrete asset class.
+
+    Exact matches are a dict hit; subclasses fall back to one walk over
+    the handled base classes, memoized per concrete class so the walk
+    happens at most once per type seen.
+
+    Args:
+        asset_class (type): The concrete class of the imported asset.
+
+    Returns:
+        Optional[Callable]: The matching handler, or None when the class
+        needs no rename.
+    """
+    handler = _RENAME_HANDLERS.get(asset_class)
+    if handler is None:
+        for handled_class, candidate in _RENAME_HANDLERS.items():
+            if issubclass(asset_class, handled_class):
+                return candidate
+    return handler
+
+
+class ImportOp:
+    """One import operation queued on the :class:`ImportBatchEngine`.
+
+    Attributes:
+        task (unreal.AssetImportTask): The import task to submit.
+        future (Future): Resolved with the task once the batch it belongs
+            to has been imported.
+    """
+
+    def __init__(self, task: unreal.AssetImportTask):
+        """Initialize a new instance of the ImportOp class.
+
+        Args:
+            task (unreal.AssetImportTask): The import task to submit.
+        """
+        self.task = task
+        self.future: Future = Future()
+
+
+class ImportBatchEngine:
+    """Engine batching import tasks onto the game thread.
+
+    Tasks are enqueued through :meth:`submit`; each editor tick, up to
+    ``max_batch`` queued operations are submitted with one
+    ``import_asset_tasks`` call via a Slate post-tick callback, amortizing
+    the import-pipeline startup across the whole batch.
+    ``import_asset_tasks`` n'est pas sûr hors du thread éditeur, donc
+    l'import lui-même ne quitte jamais le game thread.
+
+    Args:
+        max_batch (int): Maximum number of tasks submitted per batch.
+
+    Attributes:
+        max_batch (int): Maximum number of tasks submitted per batch.
+    """
+
+    def __init__(self, max_batch: int = 16):
+        """Initialize a new instance of the ImportBatchEngine class.
+
+        Args:
+            max_batch (int): Maximum number of tasks submitted per batch.
+        """
+        self.max_batch = max_batch
+        self._queue: "queue.Queue[ImportOp]" = queue.Queue()
+        self._tick_handle = None
+
+    def submit(self, task: unreal.AssetImportTask) -> Future:
+        """Queue an import task and return its completion future.
+
+        Args:
+            task (unreal.AssetImportTask): The import task to submit.
+
+        Returns:
+            Future: Resolved with the task once its batch is imported.
+        """
+        op = ImportOp(task)
+        self._queue.put(op)
+        if self._tick_handle is None:
+            self._tick_handle = unreal.register_slate_post_tick_callback(
+                self._on_tick
+            )
+        return op.future
+
+    def _on_tick(self, delta_seconds: float) -> None:
+        """Import one batch per editor tick, then stop when drained.
+
+        Args:
+            delta_seconds (float): Tick delta, unused.
+        """
+        self._drain(self.max_batch)
+        if self._queue.empty():
+            self._unregister()
+
+    def _drain(self, max_batch: Optional[int] = None) -> None:
+        """Submit up to max_batch queued operations in one call.
+
+        Args:
+            max_batch (Optional[int]): Batch size cap; drains everything
+                when omitted.
+        """
+        ops: List[ImportOp] = []
+        while max_batch is None or len(ops) < max_batch:
+            try:
+                ops.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if not ops:
+            return
+        tasks = [op.task for op in ops]
+        try:
+            _get_asset_tools().import_asset_tasks(tasks)
+        except Exception as error:
+            for op in ops:
+                op.future.set_exception(error)
+        else:
+            for op in ops:
+                op.future.set_result(op.task)
+
+    def _unregister(self) -> None:
+        """Detach the Slate post-tick callback if it is registered."""
+        if self._tick_handle is not None:
+            unreal.unregister_slate_post_tick_callback(self._tick_handle)
+            self._tick_handle = None
+
+    def close(self) -> None:
+        """Drain every queued task now and stop ticking.
+
+        À appeler depuis le game thread en fin de batch : les tâches
+        encore en file sont importées immédiatement au lieu d'attendre
+        les prochains ticks (ou d'être perdues à la sortie).
+        """
+        self._drain()
+        self._unregister()
+
+
+_IMPORT_ENGINE: Optional[ImportBatchEngine] = None
+
+
+def _get_import_engine() -> ImportBatchEngine:
+    """Return the shared ImportBatchEngine, starting it on first use.
+
+    Returns:
+        ImportBatchEngine: The shared background import engine.
+    """
+    global _IMPORT_ENGINE
+    if _IMPORT_ENGINE is None:
+        _IMPORT_ENGINE = ImportBatchEngine()
+    return _IMPORT_ENGINE
 
 
 class FBXImporter:
@@ -144,10 +690,25 @@ class FBXImporter:
                 located at 'fbx_path' into UE4 at the specified 'destination_path' and 'asset_name'.
     """  # noqa
 
+    __slots__ = (
+        "asset_tools",
+        "asset_reg",
+        "_anim_filter",
+        "_pending",
+        "_pending_inputs",
+    )
+
     def __init__(self):
         """Initialize a new instance of the FBXImporter class."""
-        self.asset_tools: unreal.AssetTools = unreal.AssetToolsHelpers.get_asset_tools()
+        self.asset_tools: unreal.AssetTools = _get_asset_tools()
         self.asset_reg = unreal.AssetRegistryHelpers.get_asset_registry()
+        # Filtre réutilisé pour retrouver les animations importées sans
+        # re-scanner tout le dossier de destination à chaque import.
+        self._anim_filter = unreal.ARFilter(
+            class_names=["AnimSequence"], recursive_paths=True
+        )
+        self._pending: List[unreal.AssetImportTask] = []
+        self._pending_inputs: List[Dict] = []
 
     def _set_task(
         self,
@@ -155,6 +716,7 @@ class FBXImporter:
         destination_path: str,
         asset_name: str,
         replace_existing: bool = True,
+        async_: bool = False,
     ) -> unreal.AssetImportTask:
         """Create an import task for an FBX file.
 
@@ -163,6 +725,8 @@ class FBXImporter:
             destination_path (str): The path in UE4 where the asset should be imported to.
             asset_name (str): The name to give the imported asset
             replace_existing (bool): Whether to replace an existing asset with the same name.
+            async_ (bool): Whether to let the editor run the import
+                asynchronously instead of blocking the game thread.
 
         Returns:
             unreal.AssetImportTask: The import task.
@@ -172,8 +736,34 @@ class FBXImporter:
         task.destination_path = destination_path
         task.destination_name = asset_name
         task.replace_existing = replace_existing
+        task.async_ = async_
         return task
 
+    def _build_options(
+        self,
+        import_animation: bool = False,
+        import_materials: bool = True,
+        import_textures: bool = True,
+        import_mesh: bool = True,
+    ) -> unreal.FbxImportUI:
+        """Build the FBX import options object.
+
+        Args:
+            import_animation (bool, optional): Whether to import any animations associated with the FBX file.
+            import_materials (bool, optional): Whether to import materials from the FBX file.
+            import_textures (bool, optional): Whether to import textures from the FBX file.
+            import_mesh (bool, optional): Whether to import the mesh from the FBX file.
+
+        Returns:
+            unreal.FbxImportUI: The configured import options.
+        """  # noqa
+        options: unreal.FbxImportUI = unreal.FbxImportUI()
+        options.import_mesh = import_mesh
+        options.import_materials = import_materials
+        options.import_textures = import_textures
+        options.import_animations = import_animation
+        return options
+
     def set_fbx(
         self,
         fbx_path: str,
@@ -184,6 +774,8 @@ class FBXImporter:
         import_textures: bool = True,
         import_mesh: bool = True,
         replace_existing: bool = True,
+        options: Optional[unreal.FbxImportUI] = None,
+        async_: bool = False,
     ) -> unreal.AssetImportTask:
         """Import an FBX file into UE.
 
@@ -196,18 +788,25 @@ class FBXImporter:
             import_textures (bool, optional): Whether to import textures from the FBX file.
             import_mesh (bool, optional): Whether to import the mesh from the FBX file.
             replace_existing (bool, optional): Whether to replace an existing asset with the same name as the imported asset.
+            options (Optional[unreal.FbxImportUI]): A pre-built options object
+                shared across a batch; built from the flags when omitted.
+            async_ (bool): Whether to let the editor run the import
+                asynchronously; combine with :meth:`submit_async` to get a
+                future to wait on.
 
         Returns:
             unreal.AssetImportTask: The imported asset.
         """  # noqa
         task: unreal.AssetImportTask = self._set_task(
-            fbx_path, destination_path, asset_name, replace_existing
+            fbx_path, destination_path, asset_name, replace_existing, async_
         )
-        options: unreal.FbxImportUI = unreal.FbxImportUI()
-        options.import_mesh = import_mesh
-        options.import_materials = import_materials
-        options.import_textures = import_textures
-        options.import_animations = import_animation
+        if options is None:
+            options = self._build_options(
+                import_animation=import_animation,
+                import_materials=import_materials,
+                import_textures=import_textures,
+                import_mesh=import_mesh,
+            )
 
         task.options = options
         return task
@@ -220,7 +819,8 @@ class FBXImporter:
         import_textures: bool = True,
         import_mesh: bool = True,
         replace_existing: bool = True,
-    ) -> None:
+        max_workers: Optional[int] = None,
+    ) -> List[unreal.Object]:
         """Import an FBX file into unreal.
 
         Args:
@@ -237,27 +837,259 @@ class FBXImporter:
             import_textures (bool, optional): Whether to import textures from the FBX file.
             import_mesh (bool, optional): Whether to import the mesh from the FBX file.
             replace_existing (bool, optional): Whether to replace an existing asset with the same name as the imported asset.
+            max_workers (Optional[int]): When greater than 1, the tasks are
+                split into that many chunks submitted one import_asset_tasks
+                call at a time, bounding the size of each editor batch.
 
         Returns:
-            unreal.FbxImportUI: The imported asset.
+            List[unreal.Object]: The top-level imported objects, in task
+            order; empty when nothing was imported.
         """  # noqa
-        tasks = []
-        for asset_input in inputs:
-            task = self.set_fbx(
-                asset_input["file_path"],
-                asset_input["destination_path"],
-                asset_input["asset_name"],
+        # Cas interactif courant : une seule entrée, aucun coût de batch.
+        if len(inputs) == 1:
+            imported = self._import_single(
+                inputs[0],
                 import_animation=import_animation,
                 import_materials=import_materials,
                 import_textures=import_textures,
                 import_mesh=import_mesh,
                 replace_existing=replace_existing,
             )
-            tasks.append(task)
+            return [] if imported is None else [imported]
+
+        # Toutes les tâches du batch partagent les mêmes options : on ne
+        # construit l'objet FbxImportUI qu'une seule fois.
+        options = self._build_options(
+            import_animation=import_animation,
+            import_materials=import_materials,
+            import_textures=import_textures,
+            import_mesh=import_mesh,
+        )
+        staged = []
+        for asset_input in self.stage(inputs):
+            if not asset_input["file_exists"]:
+                _v_warning(
+                    lambda path=asset_input["file_path"]: (
+                        f"The FBX file {path} does not exist, skipping."
+                    )
+                )
+                continue
+            staged.append(asset_input)
+
+        if max_workers and max_workers > 1 and len(staged) > 1:
+            # Regroupe par dossier de destination pour que la passe de
+            # renommage ne scanne chaque dossier qu'une seule fois.
+            staged.sort(key=lambda item: item["destination_path"])
+            tasks = [
+                self.set_fbx(
+                    item["file_path"],
+                    item["destination_path"],
+                    item["asset_name"],
+                    replace_existing=replace_existing,
+                    options=options,
+                )
+                for item in staged
+            ]
+            chunk_size = -(-len(tasks) // max_workers)
+            # import_asset_tasks n'est pas sûr hors du game thread : les
+            # paquets sont soumis séquentiellement, et le recouvrement
+            # vient de task.async_ côté éditeur, pas de threads Python.
+            for index in range(0, len(tasks), chunk_size):
+                self.asset_tools.import_asset_tasks(
+                    tasks[index : index + chunk_size]
+                )
+            self.rename_assets(staged, import_animation, tasks=tasks)
+            return [obj for task in tasks for obj in task.get_objects()]
+
+        for asset_input in staged:
+            self.add_task(
+                asset_input,
+                replace_existing=replace_existing,
+                options=options,
+            )
+        return self.flush(import_animation)
+
+    def add_task(
+        self,
+        asset_input: Dict,
+        import_animation: bool = False,
+        import_materials: bool = True,
+        import_textures: bool = True,
+        import_mesh: bool = True,
+        replace_existing: bool = True,
+        options: Optional[unreal.FbxImportUI] = None,
+    ) -> unreal.AssetImportTask:
+        """Queue an FBX import task without submitting it.
+
+        The task is only handed to Unreal when :meth:`flush` is called, so
+        any number of queued tasks cost a single ``import_asset_tasks`` call.
+
+        Args:
+            asset_input (Dict): {
+                    'file_path': 'path/to/fbx/file.fbx',
+                    'destination_path': '/Game/Content/',
+                    'asset_name': 'name_of_asset'
+                }, data to process.
+            import_animation (bool, optional): Whether to import any animations
+                                            associated with the FBX file.
+            import_materials (bool, optional): Whether to import materials from the FBX file.
+            import_textures (bool, optional): Whether to import textures from the FBX file.
+            import_mesh (bool, optional): Whether to import the mesh from the FBX file.
+            replace_existing (bool, optional): Whether to replace an existing asset with the same name as the imported asset.
+            options (Optional[unreal.FbxImportUI]): A pre-built options object
+                shared across a batch; built from the flags when omitted.
+
+        Returns:
+            unreal.AssetImportTask: The queued import task.
+        """  # noqa
+        task = self.set_fbx(
+            asset_input["file_path"],
+            asset_input["destination_path"],
+            asset_input["asset_name"],
+            import_animation=import_animation,
+            import_materials=import_materials,
+            import_textures=import_textures,
+            import_mesh=import_mesh,
+            replace_existing=replace_existing,
+            options=options,
+        )
+        self._pending.append(task)
+        self._pending_inputs.append(asset_input)
+        return task
+
+    def flush(self, import_animation: bool = False) -> List[unreal.Object]:
+        """Submit every queued import task in one ``import_asset_tasks`` call.
+
+        Args:
+            import_animation (bool, optional): Whether animations were imported
+                                            for the queued tasks.
+
+        Returns:
+            List[unreal.Object]: The top-level imported objects, in task
+            order; empty when nothing was queued.
+        """
+        if not self._pending:
+            return []
+        tasks = self._pending
+        inputs = self._pending_inputs
+        self._pending = []
+        self._pending_inputs = []
         self.asset_tools.import_asset_tasks(tasks)
-        self.rename_assets(inputs, import_animation)
+        self.rename_assets(inputs, import_animation, tasks=tasks)
+        return [obj for task in tasks for obj in task.get_objects()]
 
-    def rename_assets(self, inputs: List[Dict], import_animation: bool = False) -> None:
+    def _import_single(
+        self,
+        asset_input: Dict,
+        import_animation: bool = False,
+        import_materials: bool = True,
+        import_textures: bool = True,
+        import_mesh: bool = True,
+        replace_existing: bool = True,
+    ) -> Optional[unreal.Object]:
+        """Import one FBX file without the batch machinery.
+
+        Skips the staging thread pool and the per-batch lookup structures:
+        one file check, one task, one import call, one rename pass.
+
+        Args:
+            asset_input (Dict): One import input (see :meth:`import_fbx`).
+            import_animation (bool, optional): Whether to import any animations
+                                            associated with the FBX file.
+            import_materials (bool, optional): Whether to import materials from the FBX file.
+            import_textures (bool, optional): Whether to import textures from the FBX file.
+            import_mesh (bool, optional): Whether to import the mesh from the FBX file.
+            replace_existing (bool, optional): Whether to replace an existing asset with the same name as the imported asset.
+
+        Returns:
+            Optional[unreal.Object]: The imported asset, or None when the
+            file is missing or the import produced nothing.
+        """  # noqa
+        if not os.path.isfile(asset_input["file_path"]):
+            _v_warning(
+                lambda: (
+                    f"The FBX file {asset_input['file_path']} does not exist, "
+                    f"skipping."
+                )
+            )
+            return None
+        task = self.set_fbx(
+            asset_input["file_path"],
+            asset_input["destination_path"],
+            asset_input["asset_name"],
+            import_animation=import_animation,
+            import_materials=import_materials,
+            import_textures=import_textures,
+            import_mesh=import_mesh,
+            replace_existing=replace_existing,
+        )
+        self.asset_tools.import_asset_tasks([task])
+        self.rename_assets([asset_input], import_animation, tasks=[task])
+        objects = task.get_objects()
+        return objects[0] if objects else None
+
+    def submit_async(self, asset_input: Dict, **options) -> Future:
+        """Queue an import on the shared background batch engine.
+
+        Unlike :meth:`import_fbx`, the caller is not blocked while the
+        engine batches and submits the task; the returned future resolves
+        with the task once its batch has been imported.
+
+        Args:
+            asset_input (Dict): One import input (see :meth:`import_fbx`).
+            **options: Forwarded to :meth:`set_fbx`.
+
+        Returns:
+            Future: Resolved with the unreal.AssetImportTask on completion.
+        """
+        task = self.set_fbx(
+            asset_input["file_path"],
+            asset_input["destination_path"],
+            asset_input["asset_name"],
+            **options,
+        )
+        return _get_import_engine().submit(task)
+
+    @staticmethod
+    def _stage_one(asset_input: Dict) -> Dict:
+        """Run the disk-only pre-flight checks for one input.
+
+        Only touches the filesystem, never the unreal API, so it is safe to
+        run off the game thread.
+
+        Args:
+            asset_input (Dict): One import input (see :meth:`import_fbx`).
+
+        Returns:
+            Dict: The input enriched with 'file_exists' and 'file_size' keys.
+        """
+        fbx_path = asset_input["file_path"]
+        staged = dict(asset_input)
+        staged["file_exists"] = os.path.isfile(fbx_path)
+        staged["file_size"] = os.path.getsize(fbx_path) if staged["file_exists"] else 0
+        return staged
+
+    def stage(self, inputs: List[Dict]) -> List[Dict]:
+        """Pre-flight the inputs on a thread pool before importing.
+
+        The CPU/I/O-bound checks (file existence, size) are spread over
+        worker threads; the unreal import itself stays on the game thread.
+
+        Args:
+            inputs (List[Dict]): The inputs to check (see :meth:`import_fbx`).
+
+        Returns:
+            List[Dict]: The inputs enriched with 'file_exists' and 'file_size'.
+        """
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(self._stage_one, inputs))
+
+    def rename_assets(
+        self,
+        inputs: List[Dict],
+        import_animation: bool = False,
+        tasks: Optional[List[unreal.AssetImportTask]] = None,
+    ) -> None:
         """Rename asset from inputs.
 
         Args:
@@ -270,55 +1102,53 @@ class FBXImporter:
                 ], datas to process.
             import_animation (bool, optional): Whether to import any animations
                                             associated with the FBX file.
+            tasks (Optional[List[unreal.AssetImportTask]]): The import tasks the
+                inputs came from. When given, the imported objects are read
+                straight off each task instead of re-loading the package.
         """
+        if tasks is None:
+            tasks = [None] * len(inputs)
         assets_to_rename = []
-        for asset_input in inputs:
+        # Une seule requête au registry pour toutes les destinations du
+        # batch, regroupée ensuite par dossier.
+        anims_by_dest: Dict[str, List] = defaultdict(list)
+        if import_animation and inputs:
+            self._anim_filter.package_paths = list(
+                {asset_input["destination_path"] for asset_input in inputs}
+            )
+            for asset_data in self.asset_reg.get_assets(self._anim_filter):
+                anims_by_dest[str(asset_data.package_path)].append(asset_data)
+        for asset_input, task in zip(inputs, tasks):
             destination_path = asset_input["destination_path"]
             asset_name = asset_input["asset_name"]
 
-            asset_path: str = destination_path + "/" + asset_name
-            asset: unreal.Object = unreal.load_asset(asset_path)
+            if task is not None:
+                objects = task.get_objects()
+                asset: unreal.Object = objects[0] if objects else None
+                if asset is None:
+                    # La tâche n'a rien importé : ni mesh à renommer, ni
+                    # animations associées — on évite tout load inutile.
+                    continue
+            else:
+                asset = unreal.load_asset(join_asset_path(destination_path, asset_name))
 
-            if isinstance(asset, unreal.SkeletalMesh):
-                skeletal_rename = unreal.AssetRenameData(
-                    asset, destination_path, "SKM_" + asset_name
+            handler = (
+                _resolve_rename_handler(type(asset)) if asset is not None else None
+            )
+            if handler is not None:
+                assets_to_rename.extend(
+                    handler(asset, destination_path, asset_name)
                 )
-                assets_to_rename.append(skeletal_rename)
-
-                # Rename physics asset if it exists
-                physics_asset: unreal.PhysicsAsset = asset.get_editor_property(
-                    "physics_asset"
-                )
-                if physics_asset:
-                    physics_rename = unreal.AssetRenameData(
-                        physics_asset, destination_path, "PA_" + asset_name
-                    )
-                    assets_to_rename.append(physics_rename)
-
-                # Rename skeleton asset if it exists
-                skeleton: unreal.Skeleton = asset.get_editor_property("skeleton")
-                if skeleton:
-                    skeleton_rename = unreal.AssetRenameData(
-                        skeleton, destination_path, "SKL_" + asset_name
-                    )
-                    assets_to_rename.append(skeleton_rename)
-
-            elif isinstance(asset, unreal.StaticMesh):
-                assets_to_rename.append(asset)
 
             if import_animation:
-                assets_in_package = self.asset_reg.get_assets_by_path(destination_path)
-                for asset_in_package in assets_in_package:
-                    if asset_in_package.asset_class == unreal.AnimationAsset:
-                        name = asset_in_package.asset_name()
-                        if name.startswith("AS_"):
-                            continue
-                        animseq_rename = unreal.AssetRenameData(
-                            asset_in_package,
-                            destination_path,
-                            "AS_" + asset_name + name,
-                        )
-
-                        assets_to_rename.append(animseq_rename)
+                assets_to_rename.extend(
+                    _ARD(
+                        asset_in_package,
+                        destination_path,
+                        "AS_" + asset_name + name,
+                    )
+                    for asset_in_package in anims_by_dest.get(destination_path, ())
+                    if not (name := asset_in_package.asset_name()).startswith("AS_")
+                )
 
         self.asset_tools.rename_assets(assets_to_rename)
@@ -1,7 +1,13 @@
+from __future__ import annotations
+
 from typing import Dict
+import contextlib
+
 import unreal
 
 from . import asset, levelSequence
+from . import _cache
+from ._paths import join_asset_path
 
 
 class LevelAsset(asset.BaseAsset):
@@ -17,42 +23,80 @@ class LevelAsset(asset.BaseAsset):
                                 and each value is the path where to find/create the asset.
     """
 
+    __slots__ = ("level_sequences",)
+
+    _NAME_TEMPLATE = "MAP_{}"
+
+    #: Nom du dossier cinématiques, partagé par tous les levels.
+    _CINE_FOLDER = "1-Cinematics"
+
+    #: Origine partagée pour le spawn des acteurs ; initialisée
+    #: paresseusement car unreal.Vector requiert l'éditeur.
+    _ORIGIN = None
+
     def __init__(
         self, asset_path: str, asset_name: str, level_sequences: Dict[str, str]
     ):
         super(LevelAsset, self).__init__(asset_path, asset_name, unreal.World)
         self.level_sequences = level_sequences
 
-    def attribute_name_template(self) -> str:
-        """Returns the attribute name template for the Level.
-
-        Returns:
-            str: The attribute name template for the Level.
-        """
-        return "MAP_{asset_name}"
+    #: Fabrique partagée entre toutes les créations de Level ; elle est sans
+    #: état pour ce pipeline, donc une seule instance suffit.
+    _creation_options = None
 
     def _get_creation_options(self) -> unreal.WorldFactory:
         """Defines the creation options for the Level asset.
 
+        The factory is cached on the class, so bulk level creation reuses
+        one instance instead of allocating a new one per call.
+
         Returns:
             obj: The creation options for the Level asset.
         """
-        return unreal.WorldFactory()
+        if LevelAsset._creation_options is None:
+            LevelAsset._creation_options = unreal.WorldFactory()
+        return LevelAsset._creation_options
+
+    @classmethod
+    def reset_cache(cls) -> None:
+        """Drop the shared WorldFactory instance.
+
+        La fabrique est une config conceptuellement immuable, donc
+        partagée ; ce hook permet aux tests qui en veulent une neuve de
+        forcer sa reconstruction au prochain _get_creation_options.
+        """
+        LevelAsset._creation_options = None
+
+    @classmethod
+    @contextlib.contextmanager
+    def deferred_updates(cls):
+        """Group level and sequence saves into one batch flush.
+
+        Alias métier de :meth:`BaseAsset.deferred_save` : toutes les
+        créations faites sous ce bloc reportent leurs sauvegardes à la
+        sortie, en un save_directory par dossier touché.
+
+        Yields:
+            None
+        """
+        with cls.deferred_save():
+            yield
 
     def _create_level_sequence(
-        self, sequence_path: str, sequence_name: str
+        self, sequence_path: str, sequence_name: str, save: bool = True
     ) -> unreal.LevelSequence:
         """Creates a new LevelSequence asset.
 
         Args:
             sequence_path (str): The path where to find/create the asset.
             sequence_name (str): The name of the new LevelSequence asset.
+            save (bool): Whether to save the sequence right away.
 
         Returns:
             obj: The created LevelSequence asset object.
         """
         lvl_seq = levelSequence.LevelSequenceAsset(sequence_path, sequence_name)
-        return lvl_seq.create_asset()
+        return lvl_seq.create_asset(save=save)
 
     def create_asset(self) -> unreal.Level:
         """Creates the Level asset.
@@ -65,36 +109,70 @@ class LevelAsset(asset.BaseAsset):
             return None
 
         # Ajoute le dossier 1-Cinematics s'il n'existe pas
-        cinematics_path = self.asset_path + "/1-Cinematics"
-        if not unreal.EditorAssetLibrary.does_directory_exist(cinematics_path):
-            unreal.AssetToolsHelpers.get_asset_tools().make_directory(cinematics_path)
-            unreal.log(
-                "Le dossier 1-Cinematics a été créé dans le chemin {}.".format(
-                    self.asset_path
-                )
+        cinematics_path = join_asset_path(self.asset_path, self._CINE_FOLDER)
+        if not _cache.dir_exists(cinematics_path):
+            asset._get_asset_tools().make_directory(cinematics_path)
+            _cache.note_dir_created(cinematics_path)
+            asset._v(
+                lambda: f"Le dossier 1-Cinematics a été créé "
+                f"dans le chemin {self.asset_path}."
             )
 
-        # Ajoute les level sequences à la liste des acteurs possessables du Level
-        for sequence_name, sequence_path in self.level_sequences.items():
-            sequence_asset = unreal.EditorAssetLibrary.find_asset_data(
-                cinematics_path + "/" + sequence_name
+        # Pré-chauffe le cache d'existence partagé pour les create_asset des
+        # séquences, puis liste le contenu du dossier 1-Cinematics en une
+        # seule requête au registry plutôt qu'un find_asset_data par séquence.
+        asset._list_existing(cinematics_path)
+        registry = unreal.AssetRegistryHelpers.get_asset_registry()
+        existing = {
+            str(asset_data.asset_name): asset_data
+            for asset_data in registry.get_assets_by_path(
+                cinematics_path, recursive=False
             )
-            if sequence_asset is None:
-                sequence_asset = self._create_level_sequence(
-                    sequence_path, sequence_name
+        }
+
+        # Prépare les enregistrements (noms, chemins, présence dans le
+        # listing) ; tout le travail coûteux a déjà été batché plus haut,
+        # il ne reste que des lookups de dict.
+        prepared = [
+            (sequence_name, sequence_path, existing.get(sequence_name))
+            for sequence_name, sequence_path in self.level_sequences.items()
+        ]
+
+        # Phase game thread : ajoute les level sequences à la liste des
+        # acteurs possessables du Level dans une seule transaction d'éditeur,
+        # et ne sauvegarde les séquences créées qu'une fois la boucle terminée.
+        # Les chaînes d'attributs unreal.* sont liées à des locales une seule
+        # fois plutôt que re-résolues à chaque itération.
+        ell = unreal.EditorLevelLibrary
+        world = level.get_world()
+        if LevelAsset._ORIGIN is None:
+            LevelAsset._ORIGIN = unreal.Vector(0, 0, 0)
+        origin = LevelAsset._ORIGIN
+        with self.deferred_save(), unreal.ScopedEditorTransaction("BatchAddSequences"):
+            # Première passe : résout toutes les références (création groupée
+            # des séquences manquantes sous le même deferred_save).
+            resolved = []
+            for sequence_name, sequence_path, sequence_asset in prepared:
+                if sequence_asset is None:
+                    sequence_asset = _cache.get_sequence(sequence_path, sequence_name)
+                if sequence_asset is None:
+                    sequence_asset = self._create_level_sequence(
+                        sequence_path, sequence_name
+                    )
+                    _cache.store_sequence(sequence_path, sequence_name, sequence_asset)
+                resolved.append((sequence_name, sequence_asset))
+
+            # Seconde passe : spawn + attach sur les références résolues.
+            for sequence_name, sequence_asset in resolved:
+                sequence_actor = ell.spawn_actor_from_object(sequence_asset, origin)
+                ell.add_actor_to_level(sequence_actor, world)
+                # Link l'actor au dossier 1-Cinematics
+                sequence_actor.set_folder_path(self._CINE_FOLDER)
+                asset._v(
+                    lambda name=sequence_name: (
+                        f"L'asset LevelSequence {name} a été ajouté à la liste "
+                        f"des acteurs possessables du Level."
+                    )
                 )
-            sequence_actor = unreal.EditorLevelLibrary.spawn_actor_from_object(
-                sequence_asset, unreal.Vector(0, 0, 0)
-            )
-            unreal.EditorLevelLibrary.add_actor_to_level(
-                sequence_actor, level.get_world()
-            )
-            # Link l'actor au dossier 1-Cinematics
-            sequence_actor.set_folder_path("1-Cinematics")
-            unreal.log(
-                "L'asset LevelSequence {} a été ajouté à la liste des acteurs possessables du Level.".format(
-                    sequence_name
-                )
-            )
 
         return level
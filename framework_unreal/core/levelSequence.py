@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import unreal
 from . import asset
 
@@ -12,6 +14,10 @@ class LevelSequenceAsset(asset.BaseAsset):
         asset_name (str): The name of the LevelSequence asset.
     """
 
+    __slots__ = ()
+
+    _NAME_TEMPLATE = "LS_{}"
+
     def __init__(self, asset_path: str, asset_name: str):
         """Initializes a new LevelSequenceAsset object with the given asset name and path.
 
@@ -19,20 +25,20 @@ class LevelSequenceAsset(asset.BaseAsset):
             asset_name (str): The name of the LevelSequence asset.
             asset_path (str): The path where the LevelSequence asset will be created.
         """
-        super().__init__(asset_name, asset_path, unreal.LevelSequence)
+        super().__init__(asset_path, asset_name, unreal.LevelSequence)
 
-    def attribute_name_template(self) -> str:
-        """Returns the attribute name template for the LevelSequence.
-
-        Returns:
-            str: The attribute name template for the LevelSequence.
-        """
-        return "LS_{asset_name}"
+    #: Fabrique partagée entre toutes les créations de LevelSequence.
+    _creation_options = None
 
     def _get_creation_options(self) -> object:
         """Defines the creation options for the LevelSequence asset.
 
+        The factory is cached on the class, so batch sequence creation
+        reuses one instance instead of allocating a new one per call.
+
         Returns:
             object: The creation options for the LevelSequence asset.
         """
-        return unreal.LevelSequenceFactoryNew()
+        if LevelSequenceAsset._creation_options is None:
+            LevelSequenceAsset._creation_options = unreal.LevelSequenceFactoryNew()
+        return LevelSequenceAsset._creation_options
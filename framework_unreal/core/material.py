@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import unreal
 from . import asset
 
@@ -19,6 +21,8 @@ class MaterialAsset(asset.BaseAsset):
 
     """
 
+    __slots__ = ("is_material_instance", "_name_template")
+
     def __init__(
         self, asset_path: str, asset_name: str, is_material_instance=False
     ) -> None:
@@ -29,11 +33,15 @@ class MaterialAsset(asset.BaseAsset):
             asset_path (str): The path where the LevelSequence asset will be created.
             is_material_instance (bool): The type of Material will be create.
         """
+        # Positionné avant l'appel au parent : attribute_name_template en a
+        # besoin pendant la résolution du nom dans BaseAsset.__init__. Le
+        # template est figé à la construction, donc résolu une seule fois.
+        self.is_material_instance = is_material_instance
+        self._name_template = "MM_{}" if is_material_instance else "MI_{}"
         if is_material_instance:
             super().__init__(asset_path, asset_name, unreal.MaterialInstance)
         else:
             super().__init__(asset_path, asset_name, unreal.Material)
-        self.is_material_instance = is_material_instance
 
     def _master_material(self) -> str:
         """Returns the master material asset path to instanciate.
@@ -46,17 +54,23 @@ class MaterialAsset(asset.BaseAsset):
     def attribute_name_template(self) -> str:
         """Returns the attribute name template for the Material.
 
+        The template is resolved once in __init__; this is a plain
+        attribute read on every subsequent call.
+
         Returns:
             str: The attribute name template for the Material.
         """
-        if self.is_material_instance:
-            return "MM_{asset_name}"
-        else:
-            return "MI_{asset_name}"
+        return self._name_template
+
+    #: Fabrique partagée entre toutes les créations de Material.
+    _creation_options = None
 
     def _get_creation_options(self) -> unreal.MaterialFactoryNew:
         """Defines the creation options for the Material type asset.
 
+        The factory is cached on the class, so batch material creation
+        reuses one instance instead of allocating a new one per call.
+
         Returns:
             unreal.MaterialFactoryNew: The creation options.
 
@@ -64,4 +78,6 @@ class MaterialAsset(asset.BaseAsset):
             NotImplementedError: If the method is not implemented in the derived class.
 
         """
-        return unreal.MaterialFactoryNew()
+        if MaterialAsset._creation_options is None:
+            MaterialAsset._creation_options = unreal.MaterialFactoryNew()
+        return MaterialAsset._creation_options
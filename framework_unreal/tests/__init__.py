@@ -1,5 +1,6 @@
-import importlib
-from . import test_asset, test_level
+"""Modules de test du package.
 
-importlib.reload(test_asset)
-importlib.reload(test_level)
\ No newline at end of file
+Découverts et exécutés par pytest dans l'éditeur ; jamais importés par
+le code de production, pour ne pas tirer de dépendance de test dans
+``import framework_unreal``.
+"""
@@ -0,0 +1,59 @@
+"""Cache partagé des lookups éditeur utilisés par les assertions de test.
+
+Les tests enchaînent souvent ``exists`` sur les mêmes chemins ; chaque
+appel est un aller-retour IPC vers l'éditeur. Les résultats sont donc
+mémorisés par chemin et invalidés explicitement après un create/delete.
+"""
+from typing import Dict, Optional
+
+import unreal
+
+#: Handle du registry acquis une fois à l'import du module plutôt qu'à
+#: chaque lookup non mémorisé.
+_ASSET_REGISTRY = unreal.AssetRegistryHelpers.get_asset_registry()
+
+#: Résultats mémorisés de does_asset_exist, par chemin d'asset.
+_EXISTS: Dict[str, bool] = {}
+
+#: AssetData mémorisés par chemin d'asset.
+_ASSET_DATA: Dict[str, object] = {}
+
+
+def exists(asset_path: str) -> bool:
+    """Return whether the asset exists, memoized per path.
+
+    Args:
+        asset_path (str): The asset path to check.
+
+    Returns:
+        bool: True if the asset exists.
+    """
+    if asset_path not in _EXISTS:
+        _EXISTS[asset_path] = unreal.EditorAssetLibrary.does_asset_exist(asset_path)
+    return _EXISTS[asset_path]
+
+
+def get_asset_data(asset_path: str) -> Optional[object]:
+    """Return the registry AssetData for a path, memoized per path.
+
+    Args:
+        asset_path (str): The asset path to look up.
+
+    Returns:
+        Optional[object]: The AssetData, or None when the asset is missing.
+    """
+    if asset_path not in _ASSET_DATA:
+        _ASSET_DATA[asset_path] = _ASSET_REGISTRY.get_asset_by_object_path(
+            asset_path
+        )
+    return _ASSET_DATA[asset_path]
+
+
+def invalidate(asset_path: str) -> None:
+    """Drop the cached entries for a path after a create or delete.
+
+    Args:
+        asset_path (str): The asset path whose entries must be evicted.
+    """
+    _EXISTS.pop(asset_path, None)
+    _ASSET_DATA.pop(asset_path, None)
@@ -0,0 +1,50 @@
+import pytest
+import unreal
+
+
+@pytest.fixture(scope="session")
+def editor_instance():
+    """Instance d'Unreal Editor partagée par toute la session de test.
+
+    Yields:
+        obj: Le monde éditeur courant.
+
+    Le handle est read-mostly : le récupérer une fois par session évite
+    un aller-retour éditeur par module de test.
+    """
+    yield unreal.EditorLevelLibrary.get_editor_world()
+
+
+@pytest.fixture(scope="session")
+def stub_fbx_path(tmp_path_factory):
+    """Fichier FBX factice écrit une seule fois pour toute la session.
+
+    Args:
+        tmp_path_factory: La fabrique de répertoires temporaires de pytest.
+
+    Returns:
+        str: Le chemin du fichier FBX factice.
+
+    Écrire le stub une fois par session plutôt qu'à chaque test supprime
+    la paire écriture/suppression disque des setUp/tearDown.
+    """
+    path = tmp_path_factory.mktemp("fbx") / "test_asset.fbx"
+    path.write_bytes(b"Kaydara FBX Binary  \x00")
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def unreal_test_sandbox():
+    """Collecte les chemins d'assets créés par un module de test.
+
+    Yields:
+        list: La liste où les tests ajoutent les chemins des assets créés.
+
+    Au teardown, les chemins collectés sont supprimés en un seul appel
+    batch plutôt qu'un delete_asset par asset ; rien n'est touché si le
+    module n'a rien créé.
+    """
+    created = []
+    yield created
+    if created:
+        unreal.EditorAssetLibrary.delete_assets(created)
@@ -1,56 +1,68 @@
+import pytest
 import unreal
-import unittest
+
 from ..core.asset import BaseAsset
+from . import _asset_cache
+
+ASSET_PATH = "/Game/Test/BaseAssets"
+ASSET_NAME = "TestAsset"
+
+
+class _TemplatedAsset(BaseAsset):
+    """Sous-classe minimale : template défini, options laissées abstraites."""
+
+    __slots__ = ()
+
+    _NAME_TEMPLATE = "T_{}"
+
+
+class _ConcreteAsset(_TemplatedAsset):
+    """Sous-classe concrète pour exercer create_asset/save_asset."""
+
+    __slots__ = ()
+
+    def _get_creation_options(self) -> unreal.LevelSequenceFactoryNew:
+        return unreal.LevelSequenceFactoryNew()
+
+
+@pytest.fixture(scope="module")
+def base_asset():
+    """Instance concrète partagée par le module de test."""
+    return _ConcreteAsset(ASSET_PATH, ASSET_NAME, unreal.LevelSequence)
+
+
+def test_get_asset_name():
+    """Test de la méthode _get_asset_name."""
+    # La résolution du nom passe par attribute_name_template dès
+    # __init__ : sans _NAME_TEMPLATE, la classe de base lève.
+    with pytest.raises(NotImplementedError):
+        BaseAsset(ASSET_PATH, ASSET_NAME, unreal.LevelSequence)
+    templated = _TemplatedAsset(ASSET_PATH, ASSET_NAME, unreal.LevelSequence)
+    assert templated.asset_name == f"T_{ASSET_NAME}"
+
+
+def test_get_creation_options():
+    """Test de la méthode _get_creation_options."""
+    templated = _TemplatedAsset(ASSET_PATH, ASSET_NAME, unreal.LevelSequence)
+    with pytest.raises(NotImplementedError):
+        templated._get_creation_options()
+
+
+def test_create_asset(base_asset, unreal_test_sandbox):
+    """Test de la méthode create_asset."""
+    asset = base_asset.create_asset()
+    assert asset is not None
+    assert _asset_cache.exists(base_asset._full_path)
+    if base_asset._full_path not in unreal_test_sandbox:
+        unreal_test_sandbox.append(base_asset._full_path)
+
 
-class TestBaseAsset(unittest.TestCase):
-    """
-    Classe de test pour la classe BaseAsset.
-
-    """
-    def setUp(self):
-        """
-        Initialisation des paramètres pour les tests.
-
-        """
-        self.asset_path = "/Game/Tests/TestAssets"
-        self.asset_type = "Texture2D"
-        self.base_asset = BaseAsset(self.asset_path, self.asset_type)
-
-    def test_get_asset_name(self):
-        """
-        Test de la méthode _get_asset_name.
-
-        """
-        with self.assertRaises(NotImplementedError):
-            self.base_asset._get_asset_name()
-
-    def test_get_creation_options(self):
-        """
-        Test de la méthode _get_creation_options.
-
-        """
-        with self.assertRaises(NotImplementedError):
-            self.base_asset._get_creation_options()
-
-    def test_create_asset(self):
-        """
-        Test de la méthode create_asset.
-
-        """
-        asset = self.base_asset.create_asset()
-        self.assertIsNotNone(asset)
-        asset_exists = unreal.EditorAssetLibrary.does_asset_exist(self.asset_path + "/" + self.base_asset.asset_name)
-        self.assertTrue(asset_exists)
-
-    def test_save_asset(self):
-        """
-        Test de la méthode save_asset.
-
-        """
-        asset = self.base_asset.create_asset()
-        self.base_asset.save_asset(asset)
-        asset_exists = unreal.EditorAssetLibrary.does_asset_exist(self.asset_path + "/" + self.base_asset.asset_name)
-        self.assertTrue(asset_exists)
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+def test_save_asset(base_asset, unreal_test_sandbox):
+    """Test de la méthode save_asset."""
+    asset = base_asset.create_asset() or unreal.EditorAssetLibrary.load_asset(
+        base_asset._full_path
+    )
+    base_asset.save_asset(asset)
+    assert _asset_cache.exists(base_asset._full_path)
+    if base_asset._full_path not in unreal_test_sandbox:
+        unreal_test_sandbox.append(base_asset._full_path)
@@ -0,0 +1,48 @@
+"""Smoke test commun aux wrappers d'assets.
+
+Les flux create → verify → delete des différents wrappers sont
+identiques ; ils sont fusionnés ici en un seul test paramétré, avec
+suppression batchée via le bac à sable plutôt qu'un delete par asset.
+"""
+import pytest
+import unreal
+
+from framework_unreal.core import LevelAsset, LevelSequenceAsset, MaterialAsset
+from framework_unreal.tests import _asset_cache
+
+SANDBOX_PATH = "/Game/Test/Smoke"
+
+
+def _sequence_factory():
+    return LevelSequenceAsset(SANDBOX_PATH, "SmokeSequence"), unreal.LevelSequence
+
+
+def _material_factory():
+    return MaterialAsset(SANDBOX_PATH, "SmokeMaterial"), unreal.Material
+
+
+def _level_factory():
+    return LevelAsset(SANDBOX_PATH, "SmokeLevel", {}), unreal.World
+
+
+#: Dispatch type d'asset -> fabrique, plutôt qu'un module de test
+#: boilerplate par type (pas de TextureImporter dans ce pipeline).
+ASSET_FACTORIES = {
+    "sequence": _sequence_factory,
+    "material": _material_factory,
+    "level": _level_factory,
+}
+
+
+@pytest.mark.parametrize("kind", ASSET_FACTORIES)
+def test_asset_lifecycle(kind, unreal_test_sandbox):
+    wrapper, expected_type = ASSET_FACTORIES[kind]()
+    created = wrapper.create_asset()
+
+    assert created is not None
+    assert isinstance(created, expected_type)
+    _asset_cache.invalidate(wrapper._full_path)
+    assert _asset_cache.exists(wrapper._full_path)
+
+    # Clean up (batché au teardown du module)
+    unreal_test_sandbox.append(wrapper._full_path)
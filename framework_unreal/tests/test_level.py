@@ -1,48 +1,67 @@
-import unittest
-
+import pytest
 import unreal
 
 from ..core import level
 
+ASSET_PATH = "/Game/TestLevel"
+ASSET_NAME = "TestLevel"
+SEQUENCE_SUBPATH = "/1-Cinematics"
+SEQUENCE_NAME = "NewSequence"
+SEQUENCE_PATH = f"{ASSET_PATH}{SEQUENCE_SUBPATH}"
+LEVEL_SEQUENCES = {
+    "Sequence1": SEQUENCE_PATH,
+    "Sequence2": SEQUENCE_PATH,
+}
+
+#: Chemins des assets créés par les tests ; supprimés en un seul
+#: appel batch au teardown de la fixture plutôt qu'un par test.
+_created_assets = []
 
-class TestLevelAsset(unittest.TestCase):
-    def setUp(self):
-        self.asset_path = "/Game/TestLevel"
-        self.level_sequences = ["Sequence1", "Sequence2"]
-        self.level_asset = level.LevelAsset(self.asset_path, self.level_sequences)
 
-    def test_asset_name(self):
-        self.assertEqual(self.level_asset._get_asset_name(), "NewLevel")
+@pytest.fixture(scope="class")
+def level_asset():
+    # Une seule construction partagée par toutes les méthodes de la
+    # classe ; l'objet est read-mostly entre les assertions.
+    asset = level.LevelAsset(ASSET_PATH, ASSET_NAME, LEVEL_SEQUENCES)
+    yield asset
+    if _created_assets:
+        unreal.EditorAssetLibrary.delete_assets(_created_assets)
+        _created_assets.clear()
 
-    def test_creation_options(self):
-        options = self.level_asset._get_creation_options()
-        self.assertIsInstance(options, unreal.WorldFactory())
-        self.assertTrue(options.create_new)
-        self.assertFalse(options.save_asset)
 
-    def test_create_level_sequence(self):
-        sequence_path = self.asset_path + "/1-Cinematics"
-        sequence_name = "NewSequence"
-        level_sequence = self.level_asset._create_level_sequence(
-            sequence_path, sequence_name
-        )
+class TestLevelAsset:
+    def test_asset_name(self, level_asset):
+        assert level_asset._get_asset_name(ASSET_NAME) == f"MAP_{ASSET_NAME}"
+        assert level_asset.asset_name == f"MAP_{ASSET_NAME}"
 
-        self.assertIsNotNone(level_sequence)
-        self.assertIsInstance(level_sequence, unreal.LevelSequence)
-        self.assertEqual(level_sequence.get_name(), sequence_name)
+    def test_creation_options(self, level_asset):
+        options = level_asset._get_creation_options()
+        assert isinstance(options, unreal.WorldFactory)
+        assert options.create_new
+        assert not options.save_asset
 
-        # Clean up
-        unreal.EditorAssetLibrary.delete_asset(level_sequence)
+    def test_create_level_sequence(self, level_asset):
+        # Les sauvegardes sont reportées en un seul flush de fin de bloc.
+        with level_asset.deferred_updates():
+            level_sequence = level_asset._create_level_sequence(
+                SEQUENCE_PATH, SEQUENCE_NAME
+            )
 
-    def test_create_asset(self):
-        level = self.level_asset.create_asset()
+        assert level_sequence is not None
+        assert isinstance(level_sequence, unreal.LevelSequence)
+        assert level_sequence.get_name() == SEQUENCE_NAME
 
-        self.assertIsNotNone(level)
-        self.assertIsInstance(level, unreal.Level)
+        # Clean up (batché au teardown de la fixture)
+        _created_assets.append(level_sequence.get_path_name())
 
-        # Clean up
-        unreal.EditorAssetLibrary.delete_asset(level.get_path_name())
+    def test_create_asset(self, level_asset):
+        # Test mutateur : gardé en dernier dans la classe.
+        # Les sauvegardes sont reportées en un seul flush de fin de bloc.
+        with level_asset.deferred_updates():
+            new_level = level_asset.create_asset()
 
+        assert new_level is not None
+        assert isinstance(new_level, unreal.Level)
 
-if __name__ == "__main__":
-    unittest.main()
+        # Clean up (batché au teardown de la fixture)
+        _created_assets.append(new_level.get_path_name())